@@ -1,20 +1,44 @@
-from unittest.mock import MagicMock
+import contextvars
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+import pytest
+from structlog.testing import capture_logs
 
 from svarog._utils import tts
+from svarog._utils.tts import _EspeakPipe
+from svarog._utils.tts import _say_with_espeak
+from svarog._utils.tts import _split_sentences
+
+
+class _Recorder:
+    """Lightweight TTS function that records spoken texts."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, text: str) -> None:
+        self.calls.append(text)
 
 
 class TestTTS:
     """Test cases for TTS utilities."""
 
-    def setup_method(self) -> None:
-        """Set up test environment before each test."""
-        # Create a mock TTS function for most tests
-        self.mock_tts_function = MagicMock()
-        tts.set_tts_function(self.mock_tts_function)
+    @pytest.fixture(autouse=True)
+    def _override_tts_function(self) -> t.Iterator[None]:
+        """Override the TTS function with a recorder for the duration of each test."""
+        self.mock_tts_function = _Recorder()
+        with tts.tts_function_override(self.mock_tts_function):
+            yield
 
-    def teardown_method(self) -> None:
-        """Clean up test environment after each test."""
-        # Restore original TTS function
+    @pytest.fixture
+    def restore_default_tts(self) -> t.Iterator[None]:
+        """Restore the process-wide TTS function after a test that changes it."""
+        yield
         tts.enable_tts()
 
     def test_say_with_global_mock_function(self) -> None:
@@ -23,53 +47,216 @@ class TestTTS:
         tts.say(test_text)
 
         # Verify the mock function was called with the text
-        self.mock_tts_function.assert_called_once_with(test_text)
+        assert self.mock_tts_function.calls == [test_text]
 
     def test_say_with_empty_string(self) -> None:
         """Test say function with empty string."""
         tts.say("")
 
-        self.mock_tts_function.assert_called_once_with("")
+        assert self.mock_tts_function.calls == [""]
 
     def test_say_with_special_characters(self) -> None:
         """Test say function with special characters."""
         special_text = "Hello! @#$%^&*() 123"
         tts.say(special_text)
 
-        self.mock_tts_function.assert_called_once_with(special_text)
+        assert self.mock_tts_function.calls == [special_text]
 
+    @pytest.mark.usefixtures("restore_default_tts")
     def test_disable_and_enable_tts(self) -> None:
         """Test disabling and enabling TTS."""
-        # Disable TTS
+        # Disable TTS and speak from a context without an override
         tts.disable_tts()
+        with capture_logs() as logs:
+            contextvars.Context().run(tts.say, "This should be silent")
 
-        # This should not cause any errors and should use the no-op function
-        tts.say("This should be silent")
+        assert [log["event"] for log in logs] == ["🔇 TTS disabled: 'This should be silent'"]
 
         # Re-enable TTS
         tts.enable_tts()
 
         # Now it should use the real TTS function again
         # We can test this by setting a fresh mock
-        fresh_mock = MagicMock()
+        fresh_mock = _Recorder()
         tts.set_tts_function(fresh_mock)
 
         tts.say("Now it should call our mock")
-        fresh_mock.assert_called_once_with("Now it should call our mock")
+        assert fresh_mock.calls == ["Now it should call our mock"]
+
+    @pytest.mark.usefixtures("restore_default_tts")
+    def test_override_takes_precedence_over_disable_tts(self) -> None:
+        """Test that a context-local override still receives text after disabling TTS."""
+        recorder = _Recorder()
+
+        with tts.tts_function_override(recorder):
+            tts.disable_tts()
+            tts.say("Still overridden")
 
+        assert recorder.calls == ["Still overridden"]
+
+    @pytest.mark.usefixtures("restore_default_tts")
     def test_disable_tts_function(self) -> None:
         """Test the disable TTS functionality."""
         # Disable TTS and ensure it doesn't raise errors
         tts.disable_tts()
         tts.say("This should be silent")
 
+    @pytest.mark.usefixtures("restore_default_tts")
+    def test_disable_tts_silences_other_threads(self) -> None:
+        """Test that disabling TTS also silences say() called from another thread."""
+        tts.disable_tts()
+
+        with capture_logs() as logs:
+            thread = threading.Thread(target=tts.say, args=("From another thread",))
+            thread.start()
+            thread.join()
+
+        assert [log["event"] for log in logs] == ["🔇 TTS disabled: 'From another thread'"]
+
     def test_set_tts_function_directly(self) -> None:
         """Test that set_tts_function works correctly."""
         # Create a custom mock function
-        custom_mock = MagicMock()
+        custom_mock = _Recorder()
 
         # Set it and verify it's used
         tts.set_tts_function(custom_mock)
         tts.say("Direct function test")
 
-        custom_mock.assert_called_once_with("Direct function test")
+        assert custom_mock.calls == ["Direct function test"]
+
+    def test_set_tts_function_is_context_local(self) -> None:
+        """Test that overriding the TTS function in another context doesn't leak."""
+        other_recorder = _Recorder()
+        contextvars.copy_context().run(tts.set_tts_function, other_recorder)
+
+        tts.say("Context test")
+
+        assert other_recorder.calls == []
+        assert self.mock_tts_function.calls == ["Context test"]
+
+
+def _write_script(path: Path, body: str) -> Path:
+    """Write an executable shell script standing in for espeak-ng."""
+    path.write_text(f"#!/bin/sh\n{body}")
+    path.chmod(0o755)
+    return path
+
+
+class TestEspeakBackend:
+    """Test cases for the espeak-ng backend selection."""
+
+    def test_writes_text_as_single_line(self, tmp_path: Path) -> None:
+        """Test that text is written to espeak-ng as one whitespace-normalized line."""
+        output = tmp_path / "spoken.txt"
+        script = _write_script(
+            tmp_path / "espeak-ng",
+            f'while IFS= read -r line; do printf "%s\\n" "$line" >> "{output}"; done\n',
+        )
+        pipe = _EspeakPipe(which=lambda _name: str(script))
+        fallback = _Recorder()
+
+        _say_with_espeak("Hello\nworld  two", pipe=pipe, fallback=fallback)
+        pipe.close()
+
+        assert output.read_text() == "Hello world two\n"
+        assert fallback.calls == []
+
+    def test_falls_back_on_broken_pipe(self, tmp_path: Path) -> None:
+        """Test that speech falls back when espeak-ng stops reading its stdin."""
+        ready = tmp_path / "ready"
+        script = _write_script(
+            tmp_path / "espeak-ng",
+            f'IFS= read -r line\nexec 0<&-\ntouch "{ready}"\nsleep 1\n',
+        )
+        pipe = _EspeakPipe(which=lambda _name: str(script))
+        fallback = _Recorder()
+
+        _say_with_espeak("First", pipe=pipe, fallback=fallback)
+        deadline = time.monotonic() + 5
+        while not ready.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        _say_with_espeak("Second", pipe=pipe, fallback=fallback)
+        pipe.close(timeout=5)
+
+        assert fallback.calls == ["Second"]
+
+    def test_falls_back_when_espeak_is_missing(self) -> None:
+        """Test that speech falls back when espeak-ng is not on PATH."""
+        pipe = _EspeakPipe(which=lambda _name: None)
+        fallback = _Recorder()
+
+        _say_with_espeak("Hello", pipe=pipe, fallback=fallback)
+
+        assert fallback.calls == ["Hello"]
+
+    def test_missing_espeak_is_looked_up_once(self) -> None:
+        """Test that a failed espeak-ng lookup is cached instead of repeated per utterance."""
+        lookups: list[str] = []
+
+        def which(name: str) -> None:
+            lookups.append(name)
+
+        pipe = _EspeakPipe(which=which)
+        fallback = _Recorder()
+
+        _say_with_espeak("One", pipe=pipe, fallback=fallback)
+        _say_with_espeak("Two", pipe=pipe, fallback=fallback)
+
+        assert lookups == ["espeak-ng"]
+        assert fallback.calls == ["One", "Two"]
+
+    def test_falls_back_when_espeak_cannot_start(self, tmp_path: Path) -> None:
+        """Test that speech falls back when the espeak-ng process fails to start."""
+        not_executable = tmp_path / "espeak-ng"
+        not_executable.write_text("")
+        pipe = _EspeakPipe(which=lambda _name: str(not_executable))
+        fallback = _Recorder()
+
+        _say_with_espeak("Hello", pipe=pipe, fallback=fallback)
+
+        assert fallback.calls == ["Hello"]
+
+
+class TestSplitSentences:
+    """Test cases for splitting text into sentences."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Short text. Not split.", ["Short text. Not split."]),
+            (
+                (
+                    "The build has finished successfully. "
+                    "All tests passed! Do you want me to open a pull request now?"
+                ),
+                [
+                    "The build has finished successfully.",
+                    "All tests passed!",
+                    "Do you want me to open a pull request now?",
+                ],
+            ),
+            (
+                (
+                    "Dr. Smith reviewed the change set carefully. "
+                    "Version 3.14 is ready to be released to everyone today."
+                ),
+                [
+                    "Dr. Smith reviewed the change set carefully.",
+                    "Version 3.14 is ready to be released to everyone today.",
+                ],
+            ),
+            (
+                (
+                    "Done. Okay. "
+                    "The remaining work items were moved over to the next planned milestone."
+                ),
+                [
+                    "Done. Okay.",
+                    "The remaining work items were moved over to the next planned milestone.",
+                ],
+            ),
+        ],
+    )
+    def test_split_sentences(self, text: str, expected: list[str]) -> None:
+        """Test splitting text into sentences for incremental speech."""
+        assert _split_sentences(text) == expected
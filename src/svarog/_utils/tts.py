@@ -1,9 +1,17 @@
+import atexit
+import contextlib
+import contextvars
+import re
+import shutil
+import subprocess
+import threading
 import typing as t
 
-import pyttsx3
-
 from svarog._utils.svarlog_logger import logger
 
+if t.TYPE_CHECKING:
+    import pyttsx3
+
 
 class TTSProtocol(t.Protocol):
     """Protocol for TTS functions."""
@@ -12,56 +20,217 @@ class TTSProtocol(t.Protocol):
         """Speak the provided text."""
 
 
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+_SEGMENTATION_THRESHOLD = 80
+_MIN_SENTENCE_LENGTH = 10
+_ABBREVIATIONS = frozenset({"dr.", "mr.", "mrs.", "ms.", "prof.", "e.g.", "i.e.", "etc.", "vs."})
+
+_ESPEAK_EXIT_TIMEOUT = 2.0
+
+_engine: "pyttsx3.Engine | None" = None
+_engine_lock = threading.Lock()
+_speak_lock = threading.Lock()
+
+
+def _get_engine() -> "pyttsx3.Engine":  # pragma: no cover
+    """Return the shared pyttsx3 engine, initializing it on first use."""
+    global _engine  # noqa: PLW0603
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                import pyttsx3  # noqa: PLC0415
+
+                engine = pyttsx3.init()  # type: ignore[no-untyped-call]
+
+                # Configure engine settings
+                engine.setProperty("rate", 180)  # Speech rate (words per minute)
+                engine.setProperty("volume", 0.8)  # Volume (0.0 to 1.0)
+
+                _engine = engine
+    return _engine
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split long text into sentences so speech can start before the whole text is queued."""
+    if len(text) <= _SEGMENTATION_THRESHOLD:
+        return [text]
+
+    sentences: list[str] = []
+    for part in _SENTENCE_BOUNDARY_RE.split(text.strip()):
+        if sentences and (
+            len(sentences[-1]) < _MIN_SENTENCE_LENGTH
+            or sentences[-1].rsplit(maxsplit=1)[-1].lower() in _ABBREVIATIONS
+        ):
+            sentences[-1] = f"{sentences[-1]} {part}"
+        else:
+            sentences.append(part)
+    return sentences
+
+
 def _say_with_pyttsx3(text: str) -> None:  # pragma: no cover
     """Speak the provided text using pyttsx3 TTS engine."""
-    # Initialize TTS engine
-    engine = pyttsx3.init()  # type: ignore[no-untyped-call]
-
-    # Configure engine settings
-    engine.setProperty("rate", 180)  # Speech rate (words per minute)
-    engine.setProperty("volume", 0.8)  # Volume (0.0 to 1.0)
+    engine = _get_engine()
 
-    logger.debug(f"🎙️ pyttsx3 says: '{text}'")
+    logger.debug("🎙️ pyttsx3 says: '%s'", text)
 
     # Speak the text
-    engine.say(text)
-    engine.runAndWait()
+    with _speak_lock:
+        for sentence in _split_sentences(text):
+            engine.say(sentence)
+        engine.runAndWait()
 
     logger.debug("✅ Playback complete!")
 
 
+class _EspeakPipe:
+    """Persistent espeak-ng process that speaks each line written to its stdin."""
+
+    def __init__(self, *, which: t.Callable[[str], str | None] = shutil.which) -> None:
+        self._which = which
+        self._process: subprocess.Popen[bytes] | None = None
+        self._unavailable = False
+        self._lock = threading.Lock()
+
+    def _get_process(self) -> "subprocess.Popen[bytes] | None":
+        """Return the running espeak-ng process, starting it if needed, or None if unavailable."""
+        if self._unavailable:
+            return None
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        if self._process is not None:
+            _close_process(self._process)
+            self._process = None
+
+        espeak_path = self._which("espeak-ng")
+        if espeak_path is None:
+            logger.debug("espeak-ng not found, using pyttsx3")
+            self._unavailable = True
+            return None
+        try:
+            self._process = subprocess.Popen(  # noqa: S603
+                [espeak_path, "-s", "180", "-a", "80"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        except OSError as error:
+            logger.debug("Could not start espeak-ng: %s", error)
+            self._unavailable = True
+            return None
+        return self._process
+
+    def say(self, text: str) -> bool:
+        """Queue the text as a single line for espeak-ng, returning False if it can't be spoken."""
+        with self._lock:
+            process = self._get_process()
+            if process is None or process.stdin is None:
+                return False
+            logger.debug("🎙️ espeak-ng says: '%s'", text)
+            try:
+                process.stdin.write(" ".join(text.split()).encode() + b"\n")
+            except BrokenPipeError:
+                logger.debug("espeak-ng process exited, falling back to pyttsx3")
+                return False
+            return True
+
+    def close(self, *, timeout: float = _ESPEAK_EXIT_TIMEOUT) -> None:
+        """Close the espeak-ng stdin and wait for queued speech to finish."""
+        with self._lock:
+            if self._process is not None:
+                _close_process(self._process, timeout=timeout)
+                self._process = None
+
+
+def _close_process(
+    process: "subprocess.Popen[bytes]", *, timeout: float = _ESPEAK_EXIT_TIMEOUT
+) -> None:
+    """Close the process stdin and wait for it to exit, leaving it running after the timeout."""
+    if process.stdin is not None:
+        with contextlib.suppress(BrokenPipeError):
+            process.stdin.close()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        logger.debug("espeak-ng still speaking after %s seconds, leaving it running", timeout)
+
+
+_espeak_pipe = _EspeakPipe()
+atexit.register(_espeak_pipe.close)
+
+
+def _say_with_espeak(
+    text: str,
+    *,
+    pipe: _EspeakPipe = _espeak_pipe,
+    fallback: TTSProtocol = _say_with_pyttsx3,
+) -> None:
+    """Speak the provided text through espeak-ng, falling back to pyttsx3.
+
+    With espeak-ng the text is queued and this returns before playback ends; the pyttsx3
+    fallback blocks until the text has been spoken.
+    """
+    if not pipe.say(text):
+        fallback(text)
+
+
 def _noop_tts(text: str) -> None:
     """No-op TTS function for testing."""
-    logger.debug(f"🔇 TTS disabled: '{text}'")
+    logger.debug("🔇 TTS disabled: '%s'", text)
 
 
-# Global TTS function that can be easily replaced for testing
-_current_tts_function: TTSProtocol = _say_with_pyttsx3  # pragma: no cover
+# Process-wide TTS function rebound by enable_tts() / disable_tts()
+_default_tts_function: TTSProtocol = _say_with_espeak  # pragma: no cover
 
+# Optional context-local override that can be easily set for testing
+_tts_function_override: contextvars.ContextVar[TTSProtocol | None] = contextvars.ContextVar(
+    "tts_function_override", default=None
+)
 
-def set_tts_function(tts_function: TTSProtocol) -> None:  # pragma: no cover
-    """Set the TTS function to use. Useful for testing."""
-    global _current_tts_function  # noqa: PLW0603
-    _current_tts_function = tts_function
 
+def set_tts_function(tts_function: TTSProtocol) -> None:
+    """Override the TTS function in the current context. Useful for testing."""
+    _tts_function_override.set(tts_function)
 
-def disable_tts() -> None:  # pragma: no cover
-    """Disable TTS by setting a no-op function."""
-    set_tts_function(_noop_tts)
 
+@contextlib.contextmanager
+def tts_function_override(tts_function: TTSProtocol) -> t.Iterator[None]:
+    """Override the TTS function in the current context until the block exits."""
+    token = _tts_function_override.set(tts_function)
+    try:
+        yield
+    finally:
+        _tts_function_override.reset(token)
 
-def enable_tts() -> None:  # pragma: no cover
-    """Enable TTS by setting the real pyttsx3 function."""
-    set_tts_function(_say_with_pyttsx3)
+
+def disable_tts() -> None:
+    """Disable TTS for all threads by setting a no-op default function."""
+    global _default_tts_function  # noqa: PLW0603
+    _default_tts_function = _noop_tts
+
+
+def enable_tts() -> None:
+    """Enable TTS for all threads by setting the real default function."""
+    global _default_tts_function  # noqa: PLW0603
+    _default_tts_function = _say_with_espeak
 
 
 def say(text: str) -> None:
     """Speak the provided text.
 
+    A context-local override set with set_tts_function() or tts_function_override() always
+    takes precedence over the process-wide default controlled by enable_tts() / disable_tts().
+
+    With the default backend this returns as soon as espeak-ng has the text queued, and blocks
+    until playback ends only when falling back to pyttsx3.
+
     Args:
         text: The text to speak.
     """
-    _current_tts_function(text)
+    tts_function = _tts_function_override.get()
+    if tts_function is None:
+        tts_function = _default_tts_function
+    tts_function(text)
 
 
 if __name__ == "__main__":  # pragma: no cover
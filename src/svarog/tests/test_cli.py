@@ -1,34 +1,38 @@
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
+from svarog import __version__
 from svarog.cli import cli_app
 from svarog.cli import version
 
 
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Provide a CLI runner shared by all tests in the module."""
+    return CliRunner()
+
+
 class TestCLI:
     """Test cases for the main CLI interface."""
 
-    def setup_method(self) -> None:
-        """Set up test runner."""
-        self.runner = CliRunner()
-
-    def test_version_command(self) -> None:
+    def test_version_command(self, runner: CliRunner) -> None:
         """Test the version command."""
-        result = self.runner.invoke(cli_app, ["version"])
+        result = runner.invoke(cli_app, ["version"], catch_exceptions=False)
         assert result.exit_code == 0
-        assert "svarog version 0.1.0" in result.stdout
+        assert result.stdout.strip() == __version__
 
-    def test_help_command(self) -> None:
+    def test_help_command(self, runner: CliRunner) -> None:
         """Test the help command."""
-        result = self.runner.invoke(cli_app, ["--help"])
+        result = runner.invoke(cli_app, ["--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "svarog" in result.stdout
-        assert "A collection of Python utilities" in result.stdout
+        assert "A collection of utilities." in result.stdout
 
-    def test_no_args_shows_help(self) -> None:
+    def test_no_args_shows_help(self, runner: CliRunner) -> None:
         """Test that no arguments shows help."""
-        result = self.runner.invoke(cli_app, [])
+        result = runner.invoke(cli_app, [], catch_exceptions=False)
         # Typer with no_args_is_help=True shows help and exits with 2
         assert result.exit_code == 2
         assert "Usage:" in result.stdout